@@ -25,48 +25,153 @@ Legacy Tags:
     succeed: Approach worked
 """
 
+import csv
+import functools
 import json
 import os
 import re
 import subprocess
 import sys
+from collections import Counter
 from datetime import datetime, timedelta
+from itertools import islice
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson  # Optional: faster JSON serialization
+    def _json_dumps_pretty(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _json_dumps_pretty(obj) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
 # Find .sred directory (walk up from current dir)
 def find_sred_root() -> Path:
-    current = Path.cwd()
-    while current != current.parent:
-        sred_path = current / ".sred"
-        if sred_path.exists():
-            return current
-        current = current.parent
+    # SRED_ROOT lets CI and wrappers skip the upward walk entirely
+    override = os.environ.get("SRED_ROOT")
+    if override and os.path.isdir(os.path.join(override, ".sred")):
+        return Path(override)
+    current = os.getcwd()
+    while True:
+        if os.path.isdir(os.path.join(current, ".sred")):
+            return Path(current)
+        parent = os.path.dirname(current)
+        if parent == current:
+            break
+        current = parent
     raise FileNotFoundError("No .sred directory found. Run from within a project with SR&ED pipeline.")
 
 ROOT = find_sred_root()
 SRED_DIR = ROOT / ".sred"
 CONFIG_FILE = SRED_DIR / "config.json"
 
+# Pre-compiled patterns (built once at import, not per commit)
+_EXP_ID_RE = re.compile(r"(EXP-\d+)", re.IGNORECASE)
+_TAG_STRIP_RE = re.compile(r"^(exp|fail|pivot|succeed|hyp|conclude):\s*", re.IGNORECASE)
+_EXP_NUM_STRIP_RE = re.compile(r"EXP-\d+\s*", re.IGNORECASE)
+_UNCERTAINTY_RE = re.compile(r"### What technological uncertainty.*?\n(.*?)(?=###|\n## )", re.DOTALL)
+_COMMENT_RE = re.compile(r"<!--.*?-->", re.DOTALL)
+
+# Experiment template: {{PLACEHOLDER}} tokens plus two literal lines rewritten on create
+_UNCERTAINTY_PROMPT = "<!-- Be specific. \"Can we...\" or \"Is it possible to...\" -->"
+_STATUS_CHOICES = "> **STATUS:** 🔬 ACTIVE | ⏸️ PAUSED | ✅ CLOSED | ❌ ABANDONED"
+_TEMPLATE_RE = re.compile(
+    r"\{\{\w+\}\}|" + re.escape(_UNCERTAINTY_PROMPT) + "|" + re.escape(_STATUS_CHOICES)
+)
+
+_ACTIVITY_TAGS = ("exp:", "fail:", "pivot:", "succeed:")  # Tags surfaced by status/report
+_COMMIT_ICONS = {"failure": "❌", "pivot": "🔄", "success": "✅", "experiment_start": "🚀"}
+_ACTIVITY_GREP = "^(" + "|".join(t[:-1] for t in _ACTIVITY_TAGS) + "):"
+_ACTIVITY_RE = re.compile(_ACTIVITY_GREP, re.IGNORECASE)
+
+# Unit separator between fields, NUL between records (-z): commit subjects
+# may contain "|" or "," but never these control characters
+_GIT_LOG_FORMAT = "--pretty=format:%H%x1f%ad%x1f%an%x1f%s"
+
+def _iter_records(stream, sep: bytes = b"\0"):
+    """Yield sep-terminated records from a binary stream without buffering it all"""
+    pending = b""
+    for chunk in iter(lambda: stream.read(65536), b""):
+        pending += chunk
+        *records, pending = pending.split(sep)
+        yield from records
+    if pending:
+        yield pending
+
+def _iter_git_log(since: str, until: Optional[str] = None, grep: Optional[str] = None,
+                  authors: tuple = (), trunk_only: bool = False):
+    """Yield (hash, date, author, subject) for commits in the window, newest first.
+
+    Records are parsed as git writes them, so callers that keep only a few
+    commits never hold the whole log in memory. `grep` is a case-insensitive
+    extended regex that git applies to the message before writing anything;
+    `authors` restricts the log to any of the given author patterns. `trunk_only`
+    follows first parents and skips merges instead of walking every side
+    branch, for projects that record SR&ED commits on the trunk.
+    Raises subprocess.CalledProcessError (after the last record) if git fails.
+    """
+    cmd = ["git", "log", "-z", f"--since={since}", _GIT_LOG_FORMAT, "--date=short"]
+    if trunk_only:
+        cmd += ["--no-merges", "--first-parent"]
+    if until:
+        cmd.append(f"--until={until}")
+    if grep:
+        cmd += ["--extended-regexp", "--regexp-ignore-case", f"--grep={grep}"]
+    cmd += [f"--author={author}" for author in authors]
+    
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, cwd=ROOT) as proc:
+        for record in _iter_records(proc.stdout):
+            fields = record.decode("utf-8", "replace").split("\x1f", 3)
+            if len(fields) == 4:
+                yield tuple(fields)
+        stderr = proc.stderr.read().decode("utf-8", "replace")
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd, stderr=stderr)
+
+def _compile_tag_matcher(tags: dict):
+    """One anchored alternation over all tag prefixes, plus prefix -> tag name lookup"""
+    names = {prefix.lower(): name for name, prefix in tags.items()}
+    pattern = re.compile("^(" + "|".join(re.escape(p) for p in names) + ")", re.IGNORECASE)
+    return pattern, names
+
+@functools.lru_cache(maxsize=1)
 def load_config() -> dict:
     with open(CONFIG_FILE) as f:
         return json.load(f)
 
+def _trunk_only() -> bool:
+    """sred_config.first_parent_only: scan/status/report read only first-parent history"""
+    return bool(load_config()["sred_config"].get("first_parent_only", False))
+
+@functools.lru_cache(maxsize=1)
+def _commit_tag_matcher():
+    """Compiled matcher for the configured commit tags (built once per process)"""
+    return _compile_tag_matcher(load_config()["sred_config"]["commit_tags"])
+
+def _md_entries(folder: Path, prefix: str = ""):
+    """Markdown files in folder as os.DirEntry objects (dirent type, no extra stat)"""
+    with os.scandir(folder) as it:
+        return [e for e in it if e.name.endswith(".md") and e.name.startswith(prefix) and e.is_file()]
+
 def get_next_experiment_id(config: dict) -> str:
     """Generate next experiment ID (EXP-001, EXP-002, etc.)"""
     prefix = config["sred_config"]["experiment_prefix"]
     active = SRED_DIR / "active_experiments"
     completed = SRED_DIR / "completed_experiments"
     
-    existing = []
+    # Filenames are "{prefix}-NNN.md", so the number is a fixed slice of the stem
+    start = len(prefix) + 1
+    max_num = 0
     for folder in [active, completed]:
         if folder.exists():
-            for f in folder.glob(f"{prefix}-*.md"):
-                match = re.search(rf"{prefix}-(\d+)", f.stem)
-                if match:
-                    existing.append(int(match.group(1)))
+            for entry in _md_entries(folder, f"{prefix}-"):
+                try:
+                    max_num = max(max_num, int(entry.name[start:-3]))
+                except ValueError:
+                    continue  # e.g. EXP-SAMPLE.md
     
-    next_num = max(existing, default=0) + 1
+    next_num = max_num + 1
     return f"{prefix}-{next_num:03d}"
 
 def create_experiment(uncertainty: str) -> str:
@@ -78,24 +183,18 @@ def create_experiment(uncertainty: str) -> str:
     with open(template_path) as f:
         template = f.read()
     
-    # Replace placeholders
+    # Fill placeholders, insert the uncertainty question and mark as active
+    # in one pass over the template
     now = datetime.now()
-    content = template.replace("{{EXP_ID}}", exp_id)
-    content = content.replace("{{PROJECT_NAME}}", config["project"]["name"])
-    content = content.replace("{{START_DATE}}", now.strftime("%Y-%m-%d"))
-    content = content.replace("{{END_DATE}}", "")
-    
-    # Insert the uncertainty question
-    content = content.replace(
-        "<!-- Be specific. \"Can we...\" or \"Is it possible to...\" -->",
-        f"<!-- Be specific. \"Can we...\" or \"Is it possible to...\" -->\n{uncertainty}"
-    )
-    
-    # Mark as active
-    content = content.replace(
-        "> **STATUS:** 🔬 ACTIVE | ⏸️ PAUSED | ✅ CLOSED | ❌ ABANDONED",
-        "> **STATUS:** 🔬 ACTIVE"
-    )
+    replacements = {
+        "{{EXP_ID}}": exp_id,
+        "{{PROJECT_NAME}}": config["project"]["name"],
+        "{{START_DATE}}": now.date().isoformat(),
+        "{{END_DATE}}": "",
+        _UNCERTAINTY_PROMPT: f"{_UNCERTAINTY_PROMPT}\n{uncertainty}",
+        _STATUS_CHOICES: "> **STATUS:** 🔬 ACTIVE",
+    }
+    content = _TEMPLATE_RE.sub(lambda m: replacements.get(m.group(0), m.group(0)), template)
     
     # Save to active experiments
     output_path = SRED_DIR / "active_experiments" / f"{exp_id}.md"
@@ -113,6 +212,45 @@ def create_experiment(uncertainty: str) -> str:
     
     return exp_id
 
+_LOG_TABLE_HEADER = b"| Date | Type |"
+_LOG_PLACEHOLDER_ROW = b"| | | | | |"
+
+def _log_table_offset(data: bytes, before_placeholder: bool = False) -> int:
+    """Byte offset where new investigation log rows go, or -1 if there is no table.
+
+    Rows go right after the header separator, or (before_placeholder) in front
+    of the empty "| | | | | |" template row when the table still has one.
+    """
+    header = data.find(_LOG_TABLE_HEADER)
+    while header > 0 and data[header - 1:header] != b"\n":
+        header = data.find(_LOG_TABLE_HEADER, header + 1)
+    if header < 0:
+        return -1
+    
+    header_end = data.find(b"\n", header)
+    separator_end = data.find(b"\n", header_end + 1) if header_end >= 0 else -1
+    body = separator_end + 1 if separator_end >= 0 else len(data)
+    
+    if before_placeholder:
+        pos = body
+        while True:
+            line_end = data.find(b"\n", pos)
+            line = data[pos:line_end if line_end >= 0 else len(data)]
+            if line.strip() == _LOG_PLACEHOLDER_ROW:
+                return pos
+            if line_end < 0:
+                break
+            pos = line_end + 1
+    return body
+
+def _splice_rows(f, data: bytes, offset: int, rows: list):
+    """Write rows at offset in an open r+b file, rewriting only the tail"""
+    block = "".join(row + "\n" for row in rows).encode("utf-8")
+    if offset == len(data) and data and not data.endswith(b"\n"):
+        block = b"\n" + block.rstrip(b"\n")
+    f.seek(offset)
+    f.write(block + data[offset:])
+
 def log_entry(exp_id: str, what_tried: str, what_happened: str, entry_type: str = "manual"):
     """Add manual log entry to experiment"""
     exp_path = SRED_DIR / "active_experiments" / f"{exp_id}.md"
@@ -120,74 +258,49 @@ def log_entry(exp_id: str, what_tried: str, what_happened: str, entry_type: str
         print(f"❌ Experiment {exp_id} not found in active experiments")
         return
     
-    with open(exp_path) as f:
-        content = f.read()
-    
-    now = datetime.now().strftime("%Y-%m-%d %H:%M")
+    now = datetime.now().isoformat(" ", "minutes")
     new_row = f"| {now} | {entry_type} | manual | {what_tried} | {what_happened} |"
     
-    # Find the table and add row
-    lines = content.split("\n")
-    for i, line in enumerate(lines):
-        if line.startswith("| Date | Type |"):
-            # Find the empty row template and replace it, or add after header
-            for j in range(i + 2, len(lines)):
-                if lines[j].strip() == "| | | | | |":
-                    lines[j] = new_row + "\n| | | | | |"
-                    break
-            else:
-                # No empty row found, insert after separator
-                lines.insert(i + 2, new_row)
-            break
-    
-    with open(exp_path, "w") as f:
-        f.write("\n".join(lines))
+    # Add the row above the empty template row (or after the separator)
+    with open(exp_path, "r+b") as f:
+        data = f.read()
+        offset = _log_table_offset(data, before_placeholder=True)
+        if offset >= 0:
+            _splice_rows(f, data, offset, [new_row])
     
     print(f"✅ Logged to {exp_id}: {what_tried[:50]}...")
 
 def scan_git_commits(since_days: int = 30):
     """Scan git log for SR&ED tagged commits and update experiments"""
-    config = load_config()
-    tags = config["sred_config"]["commit_tags"]
+    tag_re, tag_names = _commit_tag_matcher()
     
-    since_date = (datetime.now() - timedelta(days=since_days)).strftime("%Y-%m-%d")
+    since_date = (datetime.now() - timedelta(days=since_days)).date().isoformat()
     
     try:
-        result = subprocess.run(
-            ["git", "log", f"--since={since_date}", "--pretty=format:%H|%ad|%s", "--date=short"],
-            capture_output=True, text=True, cwd=ROOT
-        )
-        
-        if result.returncode != 0:
-            print(f"❌ Git error: {result.stderr}")
-            return
-        
-        commits = result.stdout.strip().split("\n")
         tagged_commits = []
         
-        for commit in commits:
-            if not commit:
-                continue
-            parts = commit.split("|", 2)
-            if len(parts) < 3:
-                continue
-            
-            commit_hash, date, message = parts
-            
-            # Check for SR&ED tags
-            for tag_name, tag_prefix in tags.items():
-                if message.lower().startswith(tag_prefix):
-                    # Extract experiment ID if present
-                    exp_match = re.search(r"(EXP-\d+)", message, re.IGNORECASE)
-                    exp_id = exp_match.group(1).upper() if exp_match else "UNLINKED"
-                    
-                    tagged_commits.append({
-                        "hash": commit_hash[:8],
-                        "date": date,
-                        "tag": tag_name,
-                        "exp_id": exp_id,
-                        "message": message
-                    })
+        try:
+            # git pre-filters on the tag alternation; the Python match only
+            # recovers which tag it was (and drops body-line-only matches)
+            for commit_hash, date, _author, message in _iter_git_log(since_date, grep=tag_re.pattern, trunk_only=_trunk_only()):
+                tag_match = tag_re.match(message)
+                if not tag_match:
+                    continue
+                
+                # Extract experiment ID if present
+                exp_match = _EXP_ID_RE.search(message)
+                exp_id = exp_match.group(1).upper() if exp_match else "UNLINKED"
+                
+                tagged_commits.append({
+                    "hash": commit_hash[:8],
+                    "date": date,
+                    "tag": tag_names[tag_match.group(1).lower()],
+                    "exp_id": exp_id,
+                    "message": message
+                })
+        except subprocess.CalledProcessError as e:
+            print(f"❌ Git error: {e.stderr}")
+            return
         
         if not tagged_commits:
             print(f"No SR&ED tagged commits found in last {since_days} days")
@@ -204,46 +317,57 @@ def scan_git_commits(since_days: int = 30):
             by_exp[exp_id].append(c)
         
         for exp_id, commits in by_exp.items():
-            print(f"\n🔬 {exp_id}:")
+            # One write per experiment; the batch update below may report errors
+            out = [f"\n🔬 {exp_id}:"]
             for c in commits:
-                icon = {"failure": "❌", "pivot": "🔄", "success": "✅", "experiment_start": "🚀"}.get(c["tag"], "📝")
-                print(f"   {icon} [{c['date']}] {c['message'][:60]}...")
-                
-                # Auto-update experiment manifest if it exists
-                if exp_id != "UNLINKED":
-                    update_experiment_from_commit(exp_id, c)
+                icon = _COMMIT_ICONS.get(c["tag"], "📝")
+                out.append(f"   {icon} [{c['date']}] {c['message'][:60]}...")
+            sys.stdout.write("\n".join(out) + "\n")
+            
+            # Auto-update experiment manifest if it exists (one rewrite per file)
+            if exp_id != "UNLINKED":
+                update_experiment_batch(exp_id, commits)
         
     except FileNotFoundError:
         print("❌ Git not found or not a git repository")
 
-def update_experiment_from_commit(exp_id: str, commit: dict):
-    """Update experiment manifest with commit data"""
-    exp_path = SRED_DIR / "active_experiments" / f"{exp_id}.md"
-    if not exp_path.exists():
-        return
-    
-    with open(exp_path) as f:
-        content = f.read()
-    
-    # Add to investigation log table
+def _commit_log_row(commit: dict) -> str:
+    """Investigation log row for a tagged commit"""
     tag_display = {"failure": "FAIL", "pivot": "PIVOT", "success": "SUCCESS", "experiment_start": "START"}.get(commit["tag"], commit["tag"].upper())
     
     # Clean message (remove tag prefix)
-    clean_msg = re.sub(r"^(exp|fail|pivot|succeed|hyp|conclude):\s*", "", commit["message"], flags=re.IGNORECASE)
-    clean_msg = re.sub(r"EXP-\d+\s*", "", clean_msg, flags=re.IGNORECASE).strip()
+    clean_msg = _TAG_STRIP_RE.sub("", commit["message"])
+    clean_msg = _EXP_NUM_STRIP_RE.sub("", clean_msg).strip()
     
-    new_row = f"| {commit['date']} | {tag_display} | {commit['hash']} | {clean_msg[:40]} | (from git) |"
+    return f"| {commit['date']} | {tag_display} | {commit['hash']} | {clean_msg[:40]} | (from git) |"
+
+def update_experiment_batch(exp_id: str, commits: list):
+    """Update experiment manifest with commit data, adding all rows in a single read and write"""
+    exp_path = SRED_DIR / "active_experiments" / f"{exp_id}.md"
+    if not exp_path.exists():
+        return
     
-    # Insert row into table
-    if new_row not in content:  # Avoid duplicates
-        lines = content.split("\n")
-        for i, line in enumerate(lines):
-            if line.startswith("| Date | Type |"):
-                lines.insert(i + 2, new_row)
-                break
+    with open(exp_path, "r+b") as f:
+        data = f.read()
         
-        with open(exp_path, "w") as f:
-            f.write("\n".join(lines))
+        # Avoid duplicates: O(1) lookups against the rows already in the file
+        seen = {
+            line.strip() for line in data.decode("utf-8").split("\n")
+            if line.startswith("| ")
+        }
+        new_rows = []
+        for commit in commits:
+            row = _commit_log_row(commit)
+            if row not in seen:
+                seen.add(row)
+                new_rows.append(row)
+        if not new_rows:
+            return
+        
+        # Each row goes to the top of the table, so the last commit ends up first
+        offset = _log_table_offset(data)
+        if offset >= 0:
+            _splice_rows(f, data, offset, new_rows[::-1])
 
 def close_experiment(exp_id: str):
     """Move experiment to completed and prompt for conclusion"""
@@ -264,8 +388,7 @@ def close_experiment(exp_id: str):
     )
     
     # Add end date
-    now = datetime.now().strftime("%Y-%m-%d")
-    content = content.replace("{{END_DATE}}", now)
+    content = content.replace("{{END_DATE}}", datetime.now().date().isoformat())
     
     # Move file
     with open(completed_path, "w") as f:
@@ -278,26 +401,42 @@ def close_experiment(exp_id: str):
     print(f"   - Section 3: CONCLUSION DIFF")
     print(f"   - Estimated hours and billable SR&ED hours")
 
+def _extract_uncertainty(content: str) -> str:
+    """Technological uncertainty section of a manifest, without HTML comments"""
+    # Literal check first; the DOTALL regex only runs when the header exists
+    if "### What technological uncertainty" not in content:
+        return ""
+    uncertainty_match = _UNCERTAINTY_RE.search(content)
+    if not uncertainty_match:
+        return ""
+    uncertainty = uncertainty_match.group(1).strip()
+    if "<!--" in uncertainty:
+        uncertainty = _COMMENT_RE.sub("", uncertainty).strip()
+    return uncertainty
+
 def generate_monthly_report(month: Optional[str] = None):
     """Generate monthly evidence report for SR&ED claim"""
     config = load_config()
+    # One clock read per report: the month default and the Generated stamp agree
+    now = datetime.now()
     
     if month is None:
-        month = datetime.now().strftime("%Y-%m")
+        month = now.date().isoformat()[:7]
     
     report_path = SRED_DIR / "evidence" / "monthly" / f"{month}_evidence.md"
     
-    # Collect all experiments (active and completed)
+    # Collect a small summary per experiment (active and completed);
+    # file contents are dropped as soon as the uncertainty is extracted
     experiments = []
     for folder in ["active_experiments", "completed_experiments"]:
         folder_path = SRED_DIR / folder
         if folder_path.exists():
-            for f in folder_path.glob("*.md"):
-                with open(f) as file:
+            for entry in _md_entries(folder_path):
+                with open(entry.path) as file:
                     experiments.append({
-                        "id": f.stem,
+                        "id": entry.name[:-3],
                         "status": "active" if folder == "active_experiments" else "completed",
-                        "content": file.read()
+                        "uncertainty": _extract_uncertainty(file.read())
                     })
     
     # Generate report
@@ -306,7 +445,7 @@ def generate_monthly_report(month: Optional[str] = None):
 
 **Company:** {config['project']['company']}
 **Field of Science:** {config['project']['field_of_science']} ({config['project']['field_of_science_name']})
-**Generated:** {datetime.now().strftime("%Y-%m-%d %H:%M")}
+**Generated:** {now.isoformat(" ", "minutes")}
 
 ---
 
@@ -327,17 +466,8 @@ def generate_monthly_report(month: Optional[str] = None):
     for exp in experiments:
         report += f"### {exp['id']} ({exp['status'].upper()})\n\n"
         
-        # Extract uncertainty section
-        uncertainty_match = re.search(
-            r"### What technological uncertainty.*?\n(.*?)(?=###|\n## )",
-            exp["content"],
-            re.DOTALL
-        )
-        if uncertainty_match:
-            uncertainty = uncertainty_match.group(1).strip()
-            uncertainty = re.sub(r"<!--.*?-->", "", uncertainty).strip()
-            if uncertainty:
-                report += f"**Uncertainty:** {uncertainty[:200]}...\n\n"
+        if exp["uncertainty"]:
+            report += f"**Uncertainty:** {exp['uncertainty'][:200]}...\n\n"
         
         report += "---\n\n"
     
@@ -346,18 +476,14 @@ def generate_monthly_report(month: Optional[str] = None):
 
 """
     try:
-        result = subprocess.run(
-            ["git", "log", f"--since={month}-01", f"--until={month}-31", 
-             "--pretty=format:%ad|%s", "--date=short", "--grep=exp:", "--grep=fail:", 
-             "--grep=pivot:", "--grep=succeed:", "--all-match"],
-            capture_output=True, text=True, cwd=ROOT
-        )
-        if result.stdout:
+        # git pre-filters on any of the tags (the old --all-match required all
+        # four at once); the subject re-check drops body-line-only matches
+        commits = _iter_git_log(f"{month}-01", f"{month}-31", grep=_ACTIVITY_GREP, trunk_only=_trunk_only())
+        tagged = [(date, msg) for _hash, date, _author, msg in commits if _ACTIVITY_RE.match(msg)]
+        if tagged:
             report += "| Date | Commit Message |\n|------|----------------|\n"
-            for line in result.stdout.strip().split("\n")[:20]:  # Limit to 20
-                if "|" in line:
-                    date, msg = line.split("|", 1)
-                    report += f"| {date} | {msg[:60]} |\n"
+            for date, msg in tagged[:20]:  # Limit to 20
+                report += f"| {date} | {msg[:60]} |\n"
     except:
         report += "*Git log unavailable*\n"
     
@@ -387,45 +513,41 @@ def generate_monthly_report(month: Optional[str] = None):
 def show_status():
     """Show current SR&ED status"""
     config = load_config()
-    
-    print(f"\n🔬 SR&ED Pipeline Status — {config['project']['name']}")
-    print("=" * 50)
+    out = [f"\n🔬 SR&ED Pipeline Status — {config['project']['name']}", "=" * 50]
     
     # Active experiments
     active_path = SRED_DIR / "active_experiments"
     if active_path.exists():
-        active = list(active_path.glob("*.md"))
-        print(f"\n📂 Active Experiments: {len(active)}")
-        for f in active:
-            print(f"   • {f.stem}")
+        active = _md_entries(active_path)
+        out.append(f"\n📂 Active Experiments: {len(active)}")
+        out.extend(f"   • {entry.name[:-3]}" for entry in active)
     
     # Completed experiments
     completed_path = SRED_DIR / "completed_experiments"
     if completed_path.exists():
-        completed = list(completed_path.glob("*.md"))
-        print(f"\n✅ Completed Experiments: {len(completed)}")
-        for f in completed:
-            print(f"   • {f.stem}")
+        completed = _md_entries(completed_path)
+        out.append(f"\n✅ Completed Experiments: {len(completed)}")
+        out.extend(f"   • {entry.name[:-3]}" for entry in completed)
     
     # Recent tagged commits
-    print(f"\n📊 Recent SR&ED Commits (last 7 days):")
+    out.append(f"\n📊 Recent SR&ED Commits (last 7 days):")
     try:
-        since_date = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
-        result = subprocess.run(
-            ["git", "log", f"--since={since_date}", "--pretty=format:%s", "--oneline"],
-            capture_output=True, text=True, cwd=ROOT
-        )
-        tags = ["exp:", "fail:", "pivot:", "succeed:"]
-        tagged = [l for l in result.stdout.split("\n") if any(t in l.lower() for t in tags)]
+        since_date = (datetime.now() - timedelta(days=7)).date().isoformat()
+        # git's --grep also matches tag lines in the body, so re-check the
+        # subject; the stream is abandoned once five subjects qualify
+        commits = _iter_git_log(since_date, grep=_ACTIVITY_GREP, trunk_only=_trunk_only())
+        tagged = list(islice(
+            (msg for _hash, _date, _author, msg in commits if _ACTIVITY_RE.match(msg)), 5
+        ))
         if tagged:
-            for msg in tagged[:5]:
-                print(f"   • {msg[:60]}")
+            out.extend(f"   • {msg[:60]}" for msg in tagged)
         else:
-            print("   (none)")
+            out.append("   (none)")
     except:
-        print("   (git unavailable)")
+        out.append("   (git unavailable)")
     
-    print("\n" + "=" * 50)
+    out.append("\n" + "=" * 50)
+    sys.stdout.write("\n".join(out) + "\n")
 
 def generate_refine_prompt(content_type: str, draft: str) -> str:
     """Generate ChatGPT prompt for audit-ready refinement"""
@@ -530,39 +652,36 @@ def export_boast_package(year: str):
 
     print(f"\n📦 Generating Boast.ai package for {year}...")
 
-    # 1. Extract spike commits
+    # 1. Extract spike commits. The same git log pass also writes the full
+    #    commit log CSV (step 5), so the year's history is only read once.
+    #    The export always covers every branch; first_parent_only does not apply.
     spike_commits = []
     sred_tags = ["spike:", "exp:", "fail:", "pivot:", "succeed:"]
-
-    try:
-        result = subprocess.run(
-            ["git", "log", f"--since={year}-01-01", f"--until={year}-12-31",
-             "--pretty=format:%H|%ad|%an|%s", "--date=short"],
-            capture_output=True, text=True, cwd=ROOT
-        )
-
-        for line in result.stdout.strip().split("\n"):
-            if not line:
-                continue
-            parts = line.split("|", 3)
-            if len(parts) < 4:
-                continue
-
-            commit_hash, date, author, message = parts
-            msg_lower = message.lower()
-
-            for tag in sred_tags:
-                if msg_lower.startswith(tag):
-                    spike_commits.append({
-                        "hash": commit_hash[:8],
-                        "date": date,
-                        "author": author,
-                        "message": message,
-                        "tag": tag.rstrip(":")
-                    })
-                    break
-    except Exception as e:
-        print(f"   ⚠️ Git scan error: {e}")
+    authors = tuple(config["project"].get("authors", ()))  # Optional claimant filter
+    csv_written = False
+
+    with open(export_dir / "commit_log.csv", "w", newline="") as csv_file:
+        # csv quotes fields containing commas/quotes (author names, messages)
+        csv_out = csv.writer(csv_file, lineterminator="\n")
+        csv_out.writerow(["hash", "date", "author", "message"])
+        try:
+            for commit_hash, date, author, message in _iter_git_log(f"{year}-01-01", f"{year}-12-31", authors=authors):
+                csv_out.writerow((commit_hash, date, author, message))
+                msg_lower = message.lower()
+
+                for tag in sred_tags:
+                    if msg_lower.startswith(tag):
+                        spike_commits.append({
+                            "hash": commit_hash[:8],
+                            "date": date,
+                            "author": author,
+                            "message": message,
+                            "tag": tag.rstrip(":")
+                        })
+                        break
+            csv_written = True
+        except Exception as e:
+            print(f"   ⚠️ Git scan error: {e}")
 
     # Write spike commits
     with open(export_dir / "spike_commits.md", "w") as f:
@@ -589,26 +708,23 @@ def export_boast_package(year: str):
         print(f"   ⚠️ LAB_NOTEBOOK.md not found")
 
     # 3. Generate time summary (estimate based on commits)
+    by_tag = Counter()
+    by_month = Counter()
+    for c in spike_commits:
+        by_tag[c["tag"]] += 1
+        by_month[c["date"][:7]] += 1
+
     time_summary = {
         "year": year,
         "project": config["project"]["name"],
         "company": config["project"]["company"],
         "total_sred_commits": len(spike_commits),
-        "commits_by_tag": {},
-        "commits_by_month": {},
+        "commits_by_tag": dict(by_tag),
+        "commits_by_month": dict(by_month),
         "technological_domains": config.get("technological_domains", [])
     }
 
-    for c in spike_commits:
-        # By tag
-        tag = c["tag"]
-        time_summary["commits_by_tag"][tag] = time_summary["commits_by_tag"].get(tag, 0) + 1
-        # By month
-        month = c["date"][:7]
-        time_summary["commits_by_month"][month] = time_summary["commits_by_month"].get(month, 0) + 1
-
-    with open(export_dir / "time_summary.json", "w") as f:
-        json.dump(time_summary, f, indent=2)
+    (export_dir / "time_summary.json").write_bytes(_json_dumps_pretty(time_summary))
     print(f"   ✅ time_summary.json")
 
     # 4. Technological domains
@@ -622,19 +738,9 @@ def export_boast_package(year: str):
             f.write(f"{td['description']}\n\n")
     print(f"   ✅ technological_domains.md")
 
-    # 5. Full commit log (CSV)
-    try:
-        result = subprocess.run(
-            ["git", "log", f"--since={year}-01-01", f"--until={year}-12-31",
-             "--pretty=format:%H,%ad,%an,%s", "--date=short"],
-            capture_output=True, text=True, cwd=ROOT
-        )
-        with open(export_dir / "commit_log.csv", "w") as f:
-            f.write("hash,date,author,message\n")
-            f.write(result.stdout)
+    # 5. Full commit log (CSV), written during step 1
+    if csv_written:
         print(f"   ✅ commit_log.csv")
-    except:
-        pass
 
     print(f"\n📁 Package location: {export_dir}")
     print(f"\n💡 Send this folder to Boast.ai for SR&ED filing.")
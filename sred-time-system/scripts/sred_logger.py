@@ -17,44 +17,116 @@ Examples:
     python sred_logger.py --output TIME_LOG.md     # Write to specific file
 """
 
+import io
 import subprocess
 import re
 import json
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from typing import Optional
 import argparse
 
+try:
+    import numpy as np  # Optional: vectorized gap math for long sessions
+except ImportError:
+    np = None
+
+try:
+    import pygit2  # Optional: read history in-process instead of spawning git
+except ImportError:
+    pygit2 = None
+
+try:
+    import orjson  # Optional: faster JSON output
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _dumps(obj) -> str:
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=str)
+
 
 # SR&ED commit tags that indicate billable work
 SRED_TAGS = ['exp:', 'obs:', 'test:', 'fail:', 'succeed:', 'pivot:', 'stop:']
 
+# All tags as one anchored, case-insensitive alternation; group(1) is the bare tag
+_TAG_RE = re.compile(
+    r'^(' + '|'.join(re.escape(t.rstrip(':')) for t in SRED_TAGS) + r'):',
+    re.IGNORECASE,
+)
+
+# Hypothesis IDs referenced in commit messages (EXP-001)
+_EXP_RE = re.compile(r'EXP-\d+')
+
+# A bare --since/--until date, widened to whole days by _whole_days
+_BARE_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+# Tags that open and close a session; anything else is an intermediate step
+_START_TAGS = frozenset({'exp:'})
+_END_TAGS = frozenset({'succeed:', 'pivot:', 'stop:', 'fail:'})
+
 # Gap protection: cap any gap > this to MAX_GAP_CREDIT
 MAX_GAP_HOURS = 4.0
 MAX_GAP_CREDIT = 1.0
 
+# Below this many commits numpy's array setup costs more than the Python loop
+_NUMPY_MIN_COMMITS = 64
 
-@dataclass
+
+def _total_hours(commits: list) -> float:
+    """Sum the gaps between consecutive (time-ordered) commits, applying gap protection."""
+    if np is not None and len(commits) >= _NUMPY_MIN_COMMITS:
+        ts = np.fromiter((c.epoch for c in commits),
+                         dtype=np.float64, count=len(commits))
+        gaps = np.diff(ts) / 3600.0
+        credited = np.where(gaps > MAX_GAP_HOURS, MAX_GAP_CREDIT, gaps)
+        return round(float(credited.sum()), 2)
+    
+    total_hours = 0.0
+    for i in range(1, len(commits)):
+        gap = (commits[i].epoch - commits[i-1].epoch) / 3600
+        
+        # Gap protection rule
+        if gap > MAX_GAP_HOURS:
+            credited = MAX_GAP_CREDIT
+        else:
+            credited = gap
+        
+        total_hours += credited
+    
+    return round(total_hours, 2)
+
+
+@dataclass(slots=True)
 class Commit:
     """A single git commit with SR&ED metadata."""
     hash: str
-    timestamp: datetime
+    timestamp: datetime  # Author date, for display
+    epoch: float  # Same instant as Unix seconds, for duration math
     message: str
     tag: str  # The SR&ED tag (exp:, fail:, etc.)
+    # Pre-rendered timeline fields, so TIME_LOG.md rendering only reads attributes
+    time_str: str  # "YYYY-MM-DD HH:MM" in the author's offset
+    short_msg: str  # First 50 characters of message
     
     @property
     def is_session_start(self) -> bool:
-        return self.tag in ['exp:']
+        return self.tag in _START_TAGS
     
     @property
     def is_session_end(self) -> bool:
-        return self.tag in ['succeed:', 'pivot:', 'stop:', 'fail:']
+        return self.tag in _END_TAGS
 
 
 @dataclass
 class Session:
-    """A single SR&ED work session."""
+    """A single SR&ED work session.
+    
+    Derived values are cached on first access, so read them only once
+    build_sessions has finished adding commits to the session. The cache
+    lives in the instance __dict__, which is why Session has no __slots__.
+    """
     session_id: str
     start_commit: Commit
     end_commit: Optional[Commit] = None
@@ -64,24 +136,24 @@ class Session:
     def is_complete(self) -> bool:
         return self.end_commit is not None
     
-    @property
+    @cached_property
     def hypothesis_id(self) -> str:
         """Extract hypothesis ID from commit message (e.g., EXP-001)."""
-        match = re.search(r'EXP-\d+', self.start_commit.message)
+        match = _EXP_RE.search(self.start_commit.message)
         return match.group(0) if match else "UNKNOWN"
     
-    @property
+    @cached_property
     def objective(self) -> str:
         """Extract objective from start commit message."""
         msg = self.start_commit.message
-        # Remove the tag prefix
-        for tag in SRED_TAGS:
-            if msg.lower().startswith(tag):
-                msg = msg[len(tag):].strip()
-                break
+        # Remove the tag prefix (already identified when the commit was parsed)
+        tag = self.start_commit.tag
+        if msg[:len(tag)].lower() == tag:
+            msg = msg[len(tag):].strip()
         return msg[:100] + "..." if len(msg) > 100 else msg
     
-    def calculate_duration(self) -> float:
+    @cached_property
+    def duration(self) -> float:
         """
         Calculate session duration with gap protection.
         Returns hours as float.
@@ -89,93 +161,238 @@ class Session:
         if not self.is_complete:
             return 0.0
         
+        # build_sessions fills sessions from time-ordered commits, so the
+        # start/intermediate/end sequence is already chronological
         all_commits = [self.start_commit] + self.intermediate_commits + [self.end_commit]
-        all_commits.sort(key=lambda c: c.timestamp)
-        
-        total_hours = 0.0
-        for i in range(1, len(all_commits)):
-            gap = (all_commits[i].timestamp - all_commits[i-1].timestamp).total_seconds() / 3600
-            
-            # Gap protection rule
-            if gap > MAX_GAP_HOURS:
-                credited = MAX_GAP_CREDIT
-            else:
-                credited = gap
-            
-            total_hours += credited
-        
-        return round(total_hours, 2)
+        return _total_hours(all_commits)
     
-    @property
+    @cached_property
     def outcome(self) -> str:
         """Return the outcome tag of the session."""
         if not self.end_commit:
             return "IN_PROGRESS"
         return self.end_commit.tag.rstrip(':').upper()
     
-    @property
+    @cached_property
     def tags_involved(self) -> list:
         """All unique tags used in this session."""
-        tags = {self.start_commit.tag}
-        for c in self.intermediate_commits:
-            tags.add(c.tag)
-        if self.end_commit:
-            tags.add(self.end_commit.tag)
-        return sorted(list(tags))
+        commits = (self.start_commit, *self.intermediate_commits, self.end_commit)
+        return sorted({c.tag for c in commits if c})
 
 
-def get_sred_commits(repo_path: str = ".", since: str = None, until: str = None) -> list[Commit]:
+@lru_cache(maxsize=None)
+def _tz(sign: str, hh: str, mm: str) -> timezone:
+    """Shared tzinfo per UTC offset; a history only uses a handful of them."""
+    if hh == '00' and mm == '00':
+        return timezone.utc
+    offset = timedelta(hours=int(hh), minutes=int(mm))
+    return timezone(-offset if sign == '-' else offset)
+
+
+def _parse_git_iso(s: str) -> datetime:
+    """Parse git's strict ISO 8601 date (%aI), e.g. 2025-01-02T15:04:05+07:00."""
+    if len(s) == 25:
+        tz = _tz(s[19], s[20:22], s[23:25])
+    elif len(s) == 20 and s[19] == 'Z':
+        tz = timezone.utc
+    else:
+        return datetime.fromisoformat(s.replace('Z', '+00:00'))
+    return datetime(int(s[:4]), int(s[5:7]), int(s[8:10]),
+                    int(s[11:13]), int(s[14:16]), int(s[17:19]), tzinfo=tz)
+
+
+def _parse_log_record(record: str) -> Optional[Commit]:
+    """Parse one `%H|%at|%aI|%s` record; None unless the subject has an SR&ED tag."""
+    parts = record.split('|', 3)
+    if len(parts) != 4:
+        return None
+    
+    commit_hash, epoch_str, timestamp_str, message = parts
+    
+    # Check if this is an SR&ED commit
+    match = _TAG_RE.match(message)
+    if not match:
+        return None
+    
+    timestamp = _parse_git_iso(timestamp_str)
+    return Commit(
+        hash=commit_hash[:8],
+        timestamp=timestamp,
+        epoch=float(epoch_str),
+        message=message,
+        tag=match.group(1).lower() + ':',
+        # The ISO string already spells the local date and time
+        time_str=f"{timestamp_str[:10]} {timestamp_str[11:16]}",
+        short_msg=message[:50],
+    )
+
+
+def _iter_records(stream, sep: str = '\0'):
+    """Yield sep-terminated records from a text stream without buffering it all."""
+    pending = ''
+    for chunk in iter(lambda: stream.read(65536), ''):
+        pending += chunk
+        *records, pending = pending.split(sep)
+        yield from records
+    if pending:
+        yield pending
+
+
+def _read_log(cmd: list) -> tuple:
+    """Run git log -z, parsing records as git writes them; returns (commits, returncode, stderr)."""
+    commits = []
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True) as proc:
+        for record in _iter_records(proc.stdout):
+            commit = _parse_log_record(record)
+            if commit:
+                commits.append(commit)
+        stderr = proc.stderr.read()
+    return commits, proc.returncode, stderr
+
+
+def _read_git_log(repo_path: str, since: Optional[str], until: Optional[str]) -> list[Commit]:
     """
-    Extract SR&ED-tagged commits from git history.
+    Read the SR&ED commits in the date window with a git log subprocess, oldest first.
     
-    Returns commits sorted by timestamp (oldest first).
+    Raises subprocess.CalledProcessError if git fails.
     """
-    cmd = ['git', '-C', repo_path, 'log', '--pretty=format:%H|%aI|%s', '--all']
+    cmd = ['git', '-C', repo_path, 'log', '-z', '--pretty=format:%H|%at|%aI|%s', '--all']
     
     if since:
         cmd.append(f'--since={since}')
     if until:
         cmd.append(f'--until={until}')
     
+    # Let git drop untagged commits; _TAG_RE still checks the subject since
+    # --grep also matches tags at the start of body lines
+    cmd += ['-E', '-i', f'--grep={_TAG_RE.pattern}']
+    commits, returncode, stderr = _read_log(cmd)
+    
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd, stderr=stderr)
+    
+    # git lists newest first: reversing gives one ascending run, so the
+    # stable sort below is linear unless author dates are out of order
+    commits.reverse()
+    commits.sort(key=lambda c: c.epoch)
+    return commits
+
+
+def _whole_days(since: Optional[str], until: Optional[str]) -> tuple:
+    """
+    Widen plain YYYY-MM-DD bounds to cover whole days.
+    
+    git alone reads a bare date as that day at the current time of day, so
+    the same --since would select different commits depending on when it ran.
+    Anything else (relative dates such as "3.days.ago") is passed through.
+    """
+    if since and _BARE_DATE_RE.fullmatch(since):
+        since = f"{since}T00:00:00"
+    if until and _BARE_DATE_RE.fullmatch(until):
+        until = f"{until}T23:59:59"
+    return since, until
+
+
+def _subject(raw: str) -> str:
+    """
+    Rebuild git's %s from a raw commit message.
+    
+    Leading blank lines are skipped. The first paragraph's lines are joined
+    with single spaces, each with trailing whitespace trimmed. Leading
+    whitespace is kept, as git keeps it.
+    """
+    lines = []
+    for line in raw.split("\n"):
+        line = line.rstrip()
+        if line:
+            lines.append(line)
+        elif lines:
+            break
+    return " ".join(lines)
+
+
+def _pygit2_commit(c) -> Optional[Commit]:
+    """Build a Commit from a pygit2 commit, mirroring _parse_log_record; None if untagged."""
+    message = _subject(c.message)
+    match = _TAG_RE.match(message)
+    if not match:
+        return None
+    
+    author = c.author
+    timestamp = datetime.fromtimestamp(author.time, timezone(timedelta(minutes=author.offset)))
+    return Commit(
+        hash=str(c.id)[:8],
+        timestamp=timestamp,
+        epoch=float(author.time),
+        message=message,
+        tag=match.group(1).lower() + ':',
+        time_str=timestamp.strftime('%Y-%m-%d %H:%M'),
+        short_msg=message[:50],
+    )
+
+
+def _read_pygit2(repo_path: str, since: Optional[str], until: Optional[str]) -> Optional[list[Commit]]:
+    """
+    Read SR&ED commits in-process with libgit2, oldest first.
+    
+    Returns None when this backend can't answer the same question as
+    `git log --all --since --until` (free-form dates, unreadable repository),
+    so the caller falls back to the git subprocess.
+    """
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-    except subprocess.CalledProcessError as e:
-        print(f"Error reading git log: {e}")
-        return []
+        # Like git, the window applies to committer time; naive bounds are local
+        lower = datetime.fromisoformat(since).timestamp() if since else None
+        upper = datetime.fromisoformat(until).timestamp() if until else None
+        repo = pygit2.Repository(repo_path)
+        walker = repo.walk(None, pygit2.GIT_SORT_TIME)
+        # --all: every ref plus HEAD
+        if not repo.head_is_unborn:
+            walker.push(repo.head.target)
+        for name in repo.references:
+            try:
+                target = repo.references[name].peel()
+            except (KeyError, ValueError, pygit2.GitError):
+                continue
+            if isinstance(target, pygit2.Commit):
+                walker.push(target.id)
+    except (ValueError, pygit2.GitError):
+        return None
     
     commits = []
-    for line in result.stdout.strip().split('\n'):
-        if not line:
-            continue
-        
-        parts = line.split('|', 2)
-        if len(parts) != 3:
+    for c in walker:
+        if (lower is not None and c.commit_time < lower) or (upper is not None and c.commit_time > upper):
             continue
-        
-        commit_hash, timestamp_str, message = parts
-        
-        # Check if this is an SR&ED commit
-        tag = None
-        msg_lower = message.lower()
-        for t in SRED_TAGS:
-            if msg_lower.startswith(t):
-                tag = t
-                break
-        
-        if tag:
-            timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-            commits.append(Commit(
-                hash=commit_hash[:8],
-                timestamp=timestamp,
-                message=message,
-                tag=tag
-            ))
-    
-    # Sort oldest first
-    commits.sort(key=lambda c: c.timestamp)
+        commit = _pygit2_commit(c)
+        if commit:
+            commits.append(commit)
+    
+    commits.reverse()
+    commits.sort(key=lambda c: c.epoch)
     return commits
 
 
+def get_sred_commits(repo_path: str = ".", since: str = None, until: str = None) -> list[Commit]:
+    """
+    Extract SR&ED-tagged commits from git history.
+    
+    Uses pygit2 when it is installed, otherwise spawns git log.
+    
+    Returns commits sorted by timestamp (oldest first).
+    """
+    since, until = _whole_days(since, until)
+    
+    if pygit2 is not None:
+        commits = _read_pygit2(repo_path, since, until)
+        if commits is not None:
+            return commits
+    
+    try:
+        return _read_git_log(repo_path, since, until)
+    except subprocess.CalledProcessError as error:
+        print(f"Error reading git log: {error}")
+        return []
+
+
 def build_sessions(commits: list[Commit]) -> list[Session]:
     """
     Group commits into sessions.
@@ -187,10 +404,13 @@ def build_sessions(commits: list[Commit]) -> list[Session]:
     current_session = None
     session_counter = 1
     
+    # current_session is only ever an open session: it is reset to None as
+    # soon as an end commit closes it
     for commit in commits:
-        if commit.is_session_start:
+        tag = commit.tag
+        if tag in _START_TAGS:
             # Start new session
-            if current_session and not current_session.is_complete:
+            if current_session:
                 # Previous session never closed - mark as incomplete
                 sessions.append(current_session)
             
@@ -200,8 +420,8 @@ def build_sessions(commits: list[Commit]) -> list[Session]:
             )
             session_counter += 1
             
-        elif commit.is_session_end:
-            if current_session and not current_session.is_complete:
+        elif tag in _END_TAGS:
+            if current_session:
                 current_session.end_commit = commit
                 sessions.append(current_session)
                 current_session = None
@@ -226,111 +446,158 @@ def build_sessions(commits: list[Commit]) -> list[Session]:
     return sessions
 
 
-def generate_time_log(sessions: list[Session], repo_path: str = ".") -> str:
+# TIME_LOG.md building blocks, filled with %-formatting in generate_time_log
+_TIME_LOG_HEADER = """\
+# SR&ED Time Log
+
+**Project:** %s
+**Generated:** %s
+**Method:** Human wall-clock deltas based on developer actions (git commits)
+
+## Summary
+
+| Metric | Value |
+|--------|-------|
+| Total Eligible Hours | **%.2f** |
+| Complete Sessions | %d |
+| In-Progress Sessions | %d |
+
+### Methodology
+
+Time is calculated from gaps between consecutive SR&ED-tagged git commits.
+Gap protection rule: Any gap exceeding 4 hours is capped at 1.0 hour to
+prevent overclaiming during breaks, sleep, or weekends.
+
+This measures the developer's investigation time—reading, thinking, planning,
+reviewing AI outputs, debugging, testing, and decision-making—not machine
+processing time.
+
+---
+
+## Session Details
+
+"""
+
+_SESSION_HEADER = """\
+### %s: %s
+
+**Status:** %s
+**Duration:** %.2f hours
+**Outcome:** %s
+
+**Objective:** %s
+
+**Timeline:**
+
+| Time | Action | Commit |
+|------|--------|--------|
+"""
+
+_TIMELINE_ROW = "| %s | `%s` %s... | `%s` |\n"
+
+_SESSION_FOOTER = """
+**Tags Used:** %s
+
+---
+
+"""
+
+_AUDIT_NOTES = """\
+## Audit Notes
+
+This log demonstrates systematic investigation through the scientific method:
+
+1. **Hypotheses** were formed before coding (exp: commits)
+2. **Observations** were recorded during testing (obs:, test: commits)
+3. **Conclusions** were documented (succeed:, fail:, pivot: commits)
+4. **Time tracking** is contemporaneous (git timestamps)
+
+The developer designed experiments, evaluated results, and made decisions.
+AI tools (Claude, etc.) served as lab equipment for executing tests and
+generating code—the intellectual work of hypothesis formation, result
+evaluation, and pivot decisions remained with the developer.
+"""
+
+
+def generate_time_log(sessions: list[Session], durations: list[float], repo_path: str = ".") -> str:
     """
     Generate auditor-friendly TIME_LOG.md content.
+    
+    `durations` holds each session's duration, in the same order as `sessions`.
     """
-    total_hours = sum(s.calculate_duration() for s in sessions if s.is_complete)
-    complete_sessions = [s for s in sessions if s.is_complete]
-    incomplete_sessions = [s for s in sessions if not s.is_complete]
+    total_hours = 0.0
+    complete_sessions = []
+    incomplete_sessions = []
+    for s, duration in zip(sessions, durations):
+        if s.is_complete:
+            complete_sessions.append(s)
+            total_hours += duration
+        else:
+            incomplete_sessions.append(s)
     
     # Get project name from .sred-config.json if exists
-    config_path = Path(repo_path) / ".sred-config.json"
     project_name = "Unknown Project"
-    if config_path.exists():
-        try:
-            with open(config_path) as f:
-                config = json.load(f)
-                project_name = config.get("projectName", project_name)
-        except:
-            pass
-    
-    lines = [
-        "# SR&ED Time Log",
-        "",
-        f"**Project:** {project_name}",
-        f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M')}",
-        f"**Method:** Human wall-clock deltas based on developer actions (git commits)",
-        "",
-        "## Summary",
-        "",
-        f"| Metric | Value |",
-        f"|--------|-------|",
-        f"| Total Eligible Hours | **{total_hours:.2f}** |",
-        f"| Complete Sessions | {len(complete_sessions)} |",
-        f"| In-Progress Sessions | {len(incomplete_sessions)} |",
-        "",
-        "### Methodology",
-        "",
-        "Time is calculated from gaps between consecutive SR&ED-tagged git commits.",
-        "Gap protection rule: Any gap exceeding 4 hours is capped at 1.0 hour to",
-        "prevent overclaiming during breaks, sleep, or weekends.",
-        "",
-        "This measures the developer's investigation time—reading, thinking, planning,",
-        "reviewing AI outputs, debugging, testing, and decision-making—not machine",
-        "processing time.",
-        "",
-        "---",
-        "",
-        "## Session Details",
-        "",
-    ]
-    
-    for session in sessions:
-        duration = session.calculate_duration()
+    try:
+        config = json.loads((Path(repo_path) / ".sred-config.json").read_text())
+        project_name = config.get("projectName", project_name)
+    except (OSError, ValueError, AttributeError):
+        # Missing/unreadable file, invalid JSON, or not a JSON object
+        pass
+    
+    buf = io.StringIO()
+    buf.write(_TIME_LOG_HEADER % (
+        project_name,
+        datetime.now().strftime('%Y-%m-%d %H:%M'),
+        total_hours,
+        len(complete_sessions),
+        len(incomplete_sessions),
+    ))
+    
+    for session, duration in zip(sessions, durations):
         status = "✅ Complete" if session.is_complete else "🔄 In Progress"
         
-        lines.extend([
-            f"### {session.session_id}: {session.hypothesis_id}",
-            "",
-            f"**Status:** {status}",
-            f"**Duration:** {duration:.2f} hours",
-            f"**Outcome:** {session.outcome}",
-            "",
-            f"**Objective:** {session.objective}",
-            "",
-            "**Timeline:**",
-            "",
-            f"| Time | Action | Commit |",
-            f"|------|--------|--------|",
-        ])
+        buf.write(_SESSION_HEADER % (
+            session.session_id, session.hypothesis_id, status,
+            duration, session.outcome, session.objective,
+        ))
         
         all_commits = [session.start_commit] + session.intermediate_commits
         if session.end_commit:
             all_commits.append(session.end_commit)
-        all_commits.sort(key=lambda c: c.timestamp)
         
         for commit in all_commits:
-            time_str = commit.timestamp.strftime('%Y-%m-%d %H:%M')
-            lines.append(f"| {time_str} | `{commit.tag}` {commit.message[:50]}... | `{commit.hash}` |")
+            buf.write(_TIMELINE_ROW % (commit.time_str, commit.tag, commit.short_msg, commit.hash))
         
-        lines.extend([
-            "",
-            "**Tags Used:** " + ", ".join(f"`{t}`" for t in session.tags_involved),
-            "",
-            "---",
-            "",
-        ])
+        buf.write(_SESSION_FOOTER % ", ".join(f"`{t}`" for t in session.tags_involved))
     
     # Audit defense section
-    lines.extend([
-        "## Audit Notes",
-        "",
-        "This log demonstrates systematic investigation through the scientific method:",
-        "",
-        "1. **Hypotheses** were formed before coding (exp: commits)",
-        "2. **Observations** were recorded during testing (obs:, test: commits)",
-        "3. **Conclusions** were documented (succeed:, fail:, pivot: commits)",
-        "4. **Time tracking** is contemporaneous (git timestamps)",
-        "",
-        "The developer designed experiments, evaluated results, and made decisions.",
-        "AI tools (Claude, etc.) served as lab equipment for executing tests and",
-        "generating code—the intellectual work of hypothesis formation, result",
-        "evaluation, and pivot decisions remained with the developer.",
-        "",
-    ])
-    
-    return "\n".join(lines)
+    buf.write(_AUDIT_NOTES)
+    
+    return buf.getvalue()
+
+
+def generate_time_json(sessions: list[Session], durations: list[float]) -> dict:
+    """
+    Generate the --json summary.
+    
+    `durations` holds each session's duration, in the same order as `sessions`.
+    """
+    return {
+        "total_hours": sum(d for s, d in zip(sessions, durations) if s.is_complete),
+        "sessions": [
+            {
+                "id": s.session_id,
+                "hypothesis": s.hypothesis_id,
+                "objective": s.objective,
+                "duration_hours": d,
+                "outcome": s.outcome,
+                "complete": s.is_complete,
+                "start": s.start_commit.timestamp.isoformat(),
+                "end": s.end_commit.timestamp.isoformat() if s.end_commit else None,
+            }
+            for s, d in zip(sessions, durations)
+        ]
+    }
 
 
 def main():
@@ -350,26 +617,13 @@ def main():
         return
     
     sessions = build_sessions(commits)
+    # Computed once here and shared by whichever formatter runs
+    durations = [s.duration for s in sessions]
     
     if args.json:
-        output = json.dumps({
-            "total_hours": sum(s.calculate_duration() for s in sessions if s.is_complete),
-            "sessions": [
-                {
-                    "id": s.session_id,
-                    "hypothesis": s.hypothesis_id,
-                    "objective": s.objective,
-                    "duration_hours": s.calculate_duration(),
-                    "outcome": s.outcome,
-                    "complete": s.is_complete,
-                    "start": s.start_commit.timestamp.isoformat(),
-                    "end": s.end_commit.timestamp.isoformat() if s.end_commit else None,
-                }
-                for s in sessions
-            ]
-        }, indent=2)
+        output = _dumps(generate_time_json(sessions, durations))
     else:
-        output = generate_time_log(sessions, args.repo)
+        output = generate_time_log(sessions, durations, args.repo)
     
     if args.output:
         Path(args.output).write_text(output)